@@ -5,6 +5,7 @@ Comprehensive open-ended static analysis of PHP frameworks
 """
 
 import os
+import re
 import sys
 import json
 import csv
@@ -14,15 +15,63 @@ import argparse
 from datetime import datetime
 from pathlib import Path
 
+# Keywords in the surrounding context that indicate explicit host validation
+VALIDATION_RE = re.compile(
+    r'preg_match|filter_var|validate|sanitize|whitelist|blacklist|allowed|trusted|'
+    r'secure|check|verify|confirm|ensure|guard|isvalid|isallowed'
+)
+
+# Keywords on the finding line that indicate risky output or redirection
+RISK_RE = re.compile('|'.join(re.escape(keyword) for keyword in [
+    'echo', 'print', 'header(', 'setcookie', 'redirect', 'location:',
+    'url(', 'href', 'src=', 'action=', 'window.location'
+]))
+
+# Usage pattern matchers; case-insensitive ones run against the lowercased line
+PATTERN_HOST_GETTER_RE = re.compile(r'getHost|getHttpHost')
+PATTERN_CONFIG_RE = re.compile(r'config|setting')
+PATTERN_STRING_OPS_RE = re.compile(r'trim|str_|Str::')
+
+
+def classify_pattern(line):
+    """Classify how a host-derived value is used on a single line.
+    Branches overlap, so their order defines precedence; keep it stable.
+    """
+    lower = line.lower()
+    if 'return' in line and PATTERN_HOST_GETTER_RE.search(line):
+        return 'Direct_Return'
+    elif 'url' in lower or 'http' in line:
+        return 'URL_Construction'
+    elif 'header' in lower:
+        return 'Header_Setting'
+    elif PATTERN_CONFIG_RE.search(lower):
+        return 'Configuration'
+    elif 'preg_match' in line or 'validate' in lower:
+        return 'Validation'
+    elif PATTERN_STRING_OPS_RE.search(line):
+        return 'String_Operations'
+    elif '->' in line and ('=' in line or '[' in line):
+        return 'Object_Properties'
+    return 'Other'
+
+
 class OpenTaintAnalyzer:
-    def __init__(self):
-        self.project_root = Path(__file__).parent
+    def __init__(self, semgrep_timeout=120):
+        # HNP_PHP_ROOT lets frozen/packaged builds point at the checkout holding frameworks/ and rules/
+        self.project_root = Path(os.environ.get("HNP_PHP_ROOT") or Path(__file__).parent)
+        self.semgrep_timeout = semgrep_timeout
         self.frameworks_dir = self.project_root / "frameworks"
         self.results_dir = self.project_root / "results"
         
         # Ensure results directory exists
         self.results_dir.mkdir(exist_ok=True)
         
+        # Only the source lines and context windows referenced by findings are
+        # kept, keyed by (path, line); each file is read once to fill them
+        self._wanted_lines = {}
+        self._line_cache = {}
+        self._context_cache = {}
+        
         # Available frameworks
         self.frameworks = {
             "1": {"name": "Laravel", "path": "laravel", "description": "Laravel Framework"},
@@ -42,20 +91,31 @@ class OpenTaintAnalyzer:
         print("Select a framework to analyze:")
         print()
         
+        present = self._list_frameworks_dir()
         for key, framework in self.frameworks.items():
-            status = "Available" if self.is_framework_available(framework["path"]) else "Not found"
+            status = "Available" if self.is_framework_available(framework["path"], present) else "Not found"
             print(f"  {key}. {framework['name']} - {framework['description']} [{status}]")
         
         print()
         print("  0. Exit")
         print("="*60)
     
-    def is_framework_available(self, framework_path):
+    def _list_frameworks_dir(self):
+        """Names of all entries in the frameworks directory, from a single scandir"""
+        try:
+            with os.scandir(self.frameworks_dir) as entries:
+                return {entry.name for entry in entries}
+        except OSError:
+            return set()
+    
+    def is_framework_available(self, framework_path, present=None):
         """Check if framework is available"""
+        if present is None:
+            present = self._list_frameworks_dir()
         if framework_path == ".":
-            return any(self.frameworks_dir.iterdir())
+            return bool(present)
         else:
-            return (self.frameworks_dir / framework_path).exists()
+            return framework_path in present
     
     def get_framework_results_dir(self, framework_name):
         """Get or create framework-specific results directory"""
@@ -66,6 +126,40 @@ class OpenTaintAnalyzer:
         framework_results_dir.mkdir(exist_ok=True)
         return framework_results_dir
     
+    def _load_snippets(self, path):
+        """Read a file once and keep only the lines and context windows findings need"""
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            lines = f.readlines()
+        for line_num in self._wanted_lines.pop(path, ()):
+            key = (path, line_num)
+            # Findings past the end of the file have no code line
+            self._line_cache[key] = lines[line_num - 1].strip() if 0 < line_num <= len(lines) else None
+            context_start = max(0, line_num - 5)
+            context_end = min(len(lines), line_num + 5)
+            self._context_cache[key] = ' '.join(lines[context_start:context_end]).lower()
+    
+    def _get_line(self, path, line_num):
+        """Stripped source line of a finding, or None when it lies past the end of the file"""
+        key = (path, line_num)
+        if key not in self._line_cache:
+            self._wanted_lines.setdefault(path, set()).add(line_num)
+            self._load_snippets(path)
+        return self._line_cache[key]
+    
+    def _context(self, path, line_num):
+        """Lowercased +/-5 line window around a finding, shared by findings on the same line"""
+        key = (path, line_num)
+        if key not in self._context_cache:
+            self._wanted_lines.setdefault(path, set()).add(line_num)
+            self._load_snippets(path)
+        return self._context_cache[key]
+    
+    def _clear_caches(self):
+        """Release cached snippets once findings have been classified"""
+        self._wanted_lines.clear()
+        self._line_cache.clear()
+        self._context_cache.clear()
+    
     def get_user_choice(self):
         """Get user's framework choice"""
         while True:
@@ -114,7 +208,7 @@ class OpenTaintAnalyzer:
         # Phase 3: Open Security Analysis
         print(f"\nPhase 3: Open Security Analysis")
         print("-" * 50)
-        security_analysis = self.analyze_open_security(discovery_file, framework_name)
+        security_analysis = self.analyze_open_security(flow_analysis, framework_name)
         if not security_analysis:
             print("Open analysis failed at security analysis phase")
             return False
@@ -167,21 +261,30 @@ class OpenTaintAnalyzer:
             "--config", str(rule_file),
             "--json",
             "--no-git-ignore",
+            "--jobs", str(os.cpu_count() or 4),
+            "--metrics=off",
+            "--no-rewrite-rule-ids",
+            "--disable-version-check",
             str(target_path)
         ]
         
+        # Stream the JSON straight to disk instead of decoding it into memory; it goes to a
+        # side file so a failed or timed-out run leaves the previous discovery output intact
+        partial_file = discovery_file.with_suffix('.json.part')
+        
         start_time = time.time()
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+            with open(partial_file, 'wb') as out:
+                result = subprocess.run(cmd, stdout=out, stderr=subprocess.PIPE, timeout=self.semgrep_timeout)
             discovery_time = time.time() - start_time
             
             if result.returncode == 0:
-                discovery_file.write_text(result.stdout)
+                os.replace(partial_file, discovery_file)
                 print(f"Open discovery completed. Results saved to {discovery_file}")
                 print(f"Took {discovery_time:.2f}s")
                 return discovery_file
             else:
-                print(f"Open discovery failed: {result.stderr}")
+                print(f"Open discovery failed: {result.stderr.decode('utf-8', errors='replace')}")
                 return None
                 
         except subprocess.TimeoutExpired:
@@ -190,153 +293,153 @@ class OpenTaintAnalyzer:
         except Exception as e:
             print(f"Error running open discovery: {e}")
             return None
+        finally:
+            try:
+                os.remove(partial_file)
+            except FileNotFoundError:
+                pass
+    
+    def _classify_findings(self, findings):
+        """Classify all findings in a single pass for flow, security and report phases"""
+        rows = []
+        patterns = {
+            'Direct_Return': 0,
+            'URL_Construction': 0,
+            'Header_Setting': 0,
+            'Configuration': 0,
+            'Validation': 0,
+            'String_Operations': 0,
+            'Object_Properties': 0,
+            'Other': 0
+        }
+        security_analysis = {
+            'Explicit_Validation': [],
+            'No_Explicit_Validation': [],
+            'Context_Dependent': []
+        }
+        
+        context_notes_by_pattern = {
+            'URL_Construction': 'URL building context',
+            'Direct_Return': 'Direct data return',
+            'Validation': 'Validation context',
+            'String_Operations': 'String manipulation'
+        }
+        
+        # Record every (path, line) up front so each file is read exactly once
+        for finding in findings:
+            line_num = finding.get('start', {}).get('line', 0)
+            self._wanted_lines.setdefault(finding.get('path', ''), set()).add(line_num)
+        
+        # Check each file once; findings in missing files are counted as Other
+        unreadable_files = {path for path in self._wanted_lines if not os.path.isfile(path)}
+        # One shared basename string per file instead of a fresh copy in every row
+        file_names = {path: os.path.basename(path) for path in self._wanted_lines}
+        
+        for finding in findings:
+            file_path = finding.get('path', '')
+            file_name = file_names[file_path]
+            line_num = finding.get('start', {}).get('line', 0)
+            col_num = finding.get('start', {}).get('col', 0)
+            
+            code_line = None
+            usage_pattern = 'Other'
+            bucket = None
+            readable = file_path not in unreadable_files
+            if readable:
+                try:
+                    code_line = self._get_line(file_path, line_num)
+                    # Get broader context (already lowercased)
+                    context = self._context(file_path, line_num)
+                except OSError:
+                    unreadable_files.add(file_path)
+                    readable = False
+            
+            if not readable:
+                patterns['Other'] += 1
+            else:
+                current_line = code_line if code_line is not None else ''
+                
+                has_validation = VALIDATION_RE.search(context) is not None
+                has_risk_usage = RISK_RE.search(current_line.lower()) is not None
+                
+                if has_validation:
+                    bucket = 'Explicit_Validation'
+                elif has_risk_usage:
+                    bucket = 'No_Explicit_Validation'
+                else:
+                    bucket = 'Context_Dependent'
+                
+                security_analysis[bucket].append({
+                    'file': file_name,
+                    'line': line_num,
+                    'code': current_line,
+                    'context': context,
+                    'has_validation': has_validation,
+                    'has_risk_usage': has_risk_usage
+                })
+                
+                # Findings past the end of the file are not counted as a usage pattern
+                if code_line is not None:
+                    usage_pattern = classify_pattern(code_line)
+                    patterns[usage_pattern] += 1
+            
+            rows.append({
+                'file': file_name,
+                'line': line_num,
+                'column': col_num,
+                'code': code_line if code_line is not None else 'N/A',
+                'usage_pattern': usage_pattern,
+                'has_validation': bucket == 'Explicit_Validation',
+                'has_risk': bucket == 'No_Explicit_Validation',
+                'context_notes': context_notes_by_pattern.get(usage_pattern, 'Standard usage')
+            })
+        
+        self._clear_caches()
+        return rows, patterns, security_analysis
     
     def analyze_open_taint_flow(self, discovery_file, framework_name):
         """Analyze open taint flow patterns"""
         print(f"Analyzing open taint flow patterns...")
         
         try:
-            with open(discovery_file, 'r') as f:
-                discovery_data = json.load(f)
+            # The raw Semgrep results are only needed for classification; keeping
+            # them local lets them be freed before reports and call graph run
+            with open(discovery_file, 'rb') as f:
+                findings = json.load(f).get('results', [])
+            total_findings = len(findings)
+            print(f"Found {total_findings} taint propagation points")
             
-            findings = discovery_data.get('results', [])
-            print(f"Found {len(findings)} taint propagation points")
-            
-            # Analyze usage patterns
-            patterns = {
-                'Direct_Return': 0,
-                'URL_Construction': 0,
-                'Header_Setting': 0,
-                'Configuration': 0,
-                'Validation': 0,
-                'String_Operations': 0,
-                'Object_Properties': 0,
-                'Other': 0
-            }
-            
-            for finding in findings:
-                try:
-                    file_path = finding.get('path', '')
-                    line_num = finding.get('start', {}).get('line', 0)
-                    
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_lines = f.readlines()
-                    
-                    if line_num <= len(file_lines):
-                        code_line = file_lines[line_num - 1].strip()
-                        
-                        # Classify usage patterns
-                        if 'return' in code_line and ('getHost' in code_line or 'getHttpHost' in code_line):
-                            patterns['Direct_Return'] += 1
-                        elif 'url' in code_line.lower() or 'http' in code_line or 'Url' in code_line:
-                            patterns['URL_Construction'] += 1
-                        elif 'header' in code_line.lower():
-                            patterns['Header_Setting'] += 1
-                        elif 'config' in code_line.lower() or 'setting' in code_line.lower():
-                            patterns['Configuration'] += 1
-                        elif 'preg_match' in code_line or 'validate' in code_line.lower():
-                            patterns['Validation'] += 1
-                        elif 'trim' in code_line or 'str_' in code_line or 'Str::' in code_line:
-                            patterns['String_Operations'] += 1
-                        elif '->' in code_line and ('=' in code_line or '[' in code_line):
-                            patterns['Object_Properties'] += 1
-                        else:
-                            patterns['Other'] += 1
-                            
-                except:
-                    patterns['Other'] += 1
+            rows, patterns, security_analysis = self._classify_findings(findings)
             
             print(f"Open taint usage patterns identified:")
             for pattern, count in patterns.items():
                 if count > 0:
-                    percentage = (count / len(findings)) * 100
+                    percentage = (count / total_findings) * 100
                     print(f"   - {pattern}: {count} ({percentage:.1f}%)")
             
             return {
-                'findings': findings,
                 'patterns': patterns,
-                'total_findings': len(findings)
+                'total_findings': total_findings,
+                'rows': rows,
+                'security_analysis': security_analysis
             }
             
         except Exception as e:
             print(f"Error analyzing taint flow: {e}")
             return None
     
-    def analyze_open_security(self, discovery_file, framework_name):
+    def analyze_open_security(self, flow_analysis, framework_name):
         """Analyze open security patterns"""
         print(f"Analyzing open security patterns...")
         
-        try:
-            with open(discovery_file, 'r') as f:
-                discovery_data = json.load(f)
-            
-            findings = discovery_data.get('results', [])
-            
-            security_analysis = {
-                'Explicit_Validation': [],
-                'No_Explicit_Validation': [],
-                'Context_Dependent': []
-            }
-            
-            for finding in findings:
-                try:
-                    file_path = finding.get('path', '')
-                    line_num = finding.get('start', {}).get('line', 0)
-                    
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        file_lines = f.readlines()
-                    
-                    # Get broader context
-                    context_start = max(0, line_num - 5)
-                    context_end = min(len(file_lines), line_num + 5)
-                    context = ' '.join(file_lines[context_start:context_end])
-                    current_line = file_lines[line_num - 1].strip() if line_num <= len(file_lines) else ''
-                    
-                    # More comprehensive validation detection
-                    validation_keywords = [
-                        'preg_match', 'filter_var', 'validate', 'sanitize', 'whitelist', 
-                        'blacklist', 'allowed', 'trusted', 'secure', 'check', 'verify', 
-                        'confirm', 'ensure', 'guard', 'isValid', 'isAllowed'
-                    ]
-                    
-                    # Risk usage detection
-                    risk_keywords = [
-                        'echo', 'print', 'header(', 'setcookie', 'redirect', 'location:',
-                        'url(', 'href', 'src=', 'action=', 'window.location'
-                    ]
-                    
-                    has_validation = any(keyword in context.lower() for keyword in validation_keywords)
-                    has_risk_usage = any(keyword in current_line.lower() for keyword in risk_keywords)
-                    
-                    analysis_item = {
-                        'file': file_path.split('/')[-1],
-                        'line': line_num,
-                        'code': current_line,
-                        'context': context,
-                        'has_validation': has_validation,
-                        'has_risk_usage': has_risk_usage
-                    }
-                    
-                    if has_validation:
-                        security_analysis['Explicit_Validation'].append(analysis_item)
-                    elif has_risk_usage:
-                        security_analysis['No_Explicit_Validation'].append(analysis_item)
-                    else:
-                        security_analysis['Context_Dependent'].append(analysis_item)
-                        
-                except:
-                    pass
-            
-            print(f"Open security analysis results:")
-            print(f"   - Explicit validation: {len(security_analysis['Explicit_Validation'])} points")
-            print(f"   - No explicit validation: {len(security_analysis['No_Explicit_Validation'])} points")
-            print(f"   - Context-dependent: {len(security_analysis['Context_Dependent'])} points")
-            
-            return security_analysis
-            
-        except Exception as e:
-            print(f"Error analyzing security: {e}")
-            return None
+        security_analysis = flow_analysis['security_analysis']
+        
+        print(f"Open security analysis results:")
+        print(f"   - Explicit validation: {len(security_analysis['Explicit_Validation'])} points")
+        print(f"   - No explicit validation: {len(security_analysis['No_Explicit_Validation'])} points")
+        print(f"   - Context-dependent: {len(security_analysis['Context_Dependent'])} points")
+        
+        return security_analysis
     
     def generate_open_reports(self, discovery_file, flow_analysis, security_analysis, framework_name):
         """Generate open analysis reports"""
@@ -347,72 +450,25 @@ class OpenTaintAnalyzer:
             
             # Generate open CSV data
             open_csv_file = results_dir / "open_taint_data.csv"
-            with open(open_csv_file, 'w', newline='', encoding='utf-8') as f:
+            with open(open_csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 writer = csv.writer(f)
                 writer.writerow([
                     'File', 'Line', 'Column', 'Code_Snippet', 'Usage_Pattern', 
                     'Has_Explicit_Validation', 'Has_Risk_Usage', 'Context_Notes'
                 ])
-                
-                for finding in flow_analysis['findings']:
-                    file_path = finding.get('path', '')
-                    file_name = file_path.split('/')[-1] if '/' in file_path else file_path
-                    line_num = finding.get('start', {}).get('line', 0)
-                    col_num = finding.get('start', {}).get('col', 0)
-                    
-                    # Get code snippet
-                    code_snippet = 'N/A'
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            file_lines = f.readlines()
-                        if line_num <= len(file_lines):
-                            code_snippet = file_lines[line_num - 1].strip()
-                    except:
-                        pass
-                    
-                    # Determine usage pattern
-                    usage_pattern = 'Other'
-                    if 'return' in code_snippet and ('getHost' in code_snippet or 'getHttpHost' in code_snippet):
-                        usage_pattern = 'Direct_Return'
-                    elif 'url' in code_snippet.lower() or 'http' in code_snippet or 'Url' in code_snippet:
-                        usage_pattern = 'URL_Construction'
-                    elif 'header' in code_snippet.lower():
-                        usage_pattern = 'Header_Setting'
-                    elif 'config' in code_snippet.lower():
-                        usage_pattern = 'Configuration'
-                    elif 'preg_match' in code_snippet or 'validate' in code_snippet.lower():
-                        usage_pattern = 'Validation'
-                    elif 'trim' in code_snippet or 'str_' in code_snippet or 'Str::' in code_snippet:
-                        usage_pattern = 'String_Operations'
-                    elif '->' in code_snippet and ('=' in code_snippet or '[' in code_snippet):
-                        usage_pattern = 'Object_Properties'
-                    
-                    # Security check status
-                    has_validation = any(item['file'] == file_name and item['line'] == line_num 
-                                       for item in security_analysis['Explicit_Validation'])
-                    has_risk = any(item['file'] == file_name and item['line'] == line_num 
-                                  for item in security_analysis['No_Explicit_Validation'])
-                    
-                    context_notes = 'Standard usage'
-                    if usage_pattern == 'URL_Construction':
-                        context_notes = 'URL building context'
-                    elif usage_pattern == 'Direct_Return':
-                        context_notes = 'Direct data return'
-                    elif usage_pattern == 'Validation':
-                        context_notes = 'Validation context'
-                    elif usage_pattern == 'String_Operations':
-                        context_notes = 'String manipulation'
-                    
-                    writer.writerow([
-                        file_name,
-                        line_num,
-                        col_num,
-                        code_snippet,
-                        usage_pattern,
-                        has_validation,
-                        has_risk,
-                        context_notes
-                    ])
+                writer.writerows(
+                    (
+                        row['file'],
+                        row['line'],
+                        row['column'],
+                        row['code'],
+                        row['usage_pattern'],
+                        row['has_validation'],
+                        row['has_risk'],
+                        row['context_notes']
+                    )
+                    for row in flow_analysis['rows']
+                )
             
             print(f"Open CSV data generated: {open_csv_file}")
             
@@ -427,19 +483,20 @@ class OpenTaintAnalyzer:
                     'no_explicit_validation': len(security_analysis['No_Explicit_Validation']),
                     'context_dependent': len(security_analysis['Context_Dependent'])
                 },
-                'files': list(set(f.get('path', '').split('/')[-1] for f in flow_analysis['findings']))
+                'files': list({row['file'] for row in flow_analysis['rows']})
             }
             
             summary_file = results_dir / "open_analysis_summary.json"
-            with open(summary_file, 'w') as f:
-                json.dump(open_summary, f, indent=2)
+            with open(summary_file, 'w', encoding='utf-8') as f:
+                json.dump(open_summary, f, ensure_ascii=False, separators=(',', ':'))
             
             print(f"Open summary generated: {summary_file}")
             
             return {
                 'csv_file': open_csv_file,
                 'summary_file': summary_file,
-                'discovery_file': discovery_file
+                'discovery_file': discovery_file,
+                'summary': open_summary
             }
             
         except Exception as e:
@@ -504,14 +561,22 @@ class OpenTaintAnalyzer:
         csv_map = {}
         try:
             with open(csv_file, newline='', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
+                reader = csv.reader(f)
+                columns = {name: i for i, name in enumerate(next(reader, []))}
+                file_col = columns['File']
+                line_col = columns['Line']
+                pattern_col = columns['Usage_Pattern']
+                validation_col = columns['Has_Explicit_Validation']
+                risk_col = columns['Has_Risk_Usage']
                 for row in reader:
-                    file_key = row.get('File')
-                    line_number = row.get('Line')
+                    file_key = row[file_col]
+                    line_number = row[line_col]
                     if not file_key or not line_number:
                         continue
+                    # Only the first row for a location is used during enrichment
                     key = (file_key, int(line_number))
-                    csv_map.setdefault(key, []).append(row)
+                    if key not in csv_map:
+                        csv_map[key] = (row[pattern_col], row[validation_col], row[risk_col])
         except Exception as e:
             print(f"Failed to read CSV data for enrichment: {e}")
             csv_map = {}
@@ -523,19 +588,11 @@ class OpenTaintAnalyzer:
         for flow in call_graph_data.get('host_flows', []):
             file_name = Path(flow.get('file', '')).name
             line_no = flow.get('line')
-            key = (file_name, line_no)
-            row = None
-            if key in csv_map:
-                row = csv_map[key][0]
-            else:
-                # Attempt to match using discovery fingerprint (optional future use)
-                row = None
+            row = csv_map.get((file_name, line_no))
 
             if row:
-                usage_pattern = row.get('Usage_Pattern', 'Unknown')
+                usage_pattern, has_validation, has_risk = row
                 flow['usage_pattern'] = usage_pattern
-                has_validation = row.get('Has_Explicit_Validation', 'False')
-                has_risk = row.get('Has_Risk_Usage', 'False')
 
                 flow['has_explicit_validation'] = has_validation.lower() == 'true'
                 flow['has_risk_usage'] = has_risk.lower() == 'true'
@@ -570,8 +627,7 @@ class OpenTaintAnalyzer:
         print("="*60)
         
         try:
-            with open(open_reports['summary_file'], 'r') as f:
-                summary = json.load(f)
+            summary = open_reports['summary']
             
             print(f"Total Taint Points: {summary['total_findings']}")
             print(f"Files Analyzed: {len(summary['files'])}")
@@ -617,7 +673,7 @@ class OpenTaintAnalyzer:
             print("="*60)
             
         except Exception as e:
-            print(f"Error reading open results: {e}")
+            print(f"Error displaying open results: {e}")
     
     def run(self):
         """Main interactive loop"""
@@ -651,9 +707,11 @@ class OpenTaintAnalyzer:
 def main():
     parser = argparse.ArgumentParser(description="Open Taint Tracking Analyzer")
     parser.add_argument("--framework", help="Directly analyze a specific framework (1-7)")
+    parser.add_argument("--semgrep-timeout", type=int, default=120,
+                        help="Timeout in seconds for the Semgrep discovery run (default: 120)")
     args = parser.parse_args()
     
-    analyzer = OpenTaintAnalyzer()
+    analyzer = OpenTaintAnalyzer(semgrep_timeout=args.semgrep_timeout)
     
     if args.framework:
         # Direct analysis mode
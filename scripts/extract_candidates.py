@@ -5,82 +5,95 @@ Extract candidate sinks from Semgrep discovery results.
 import json
 import sys
 import csv
-from typing import Dict, List, Any
+from typing import Dict, Iterator, List, Any
+
+# Stream results out of large discovery files when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_JSON_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+
+# (rule_id substring, score, sink_type), checked in precedence order
+_RULE_TABLE = (
+    ("redirect", 3, "redirect"),
+    ("cors", 2, "cors"),
+    ("cookie", 2, "cookie"),
+    ("absurl", 1, "absurl"),
+)
+
+def _iter_results(f) -> Iterator[Dict[str, Any]]:
+    """Yield Semgrep results one at a time without building the full document when possible."""
+    if ijson is not None:
+        return ijson.items(f, 'results.item', use_float=True)
+    return iter(json.load(f).get('results', []))
 
 def extract_candidate_sinks(discover_json_path: str) -> List[Dict[str, Any]]:
     """Extract candidate sink signatures from Semgrep discovery results."""
     candidates = []
     
     try:
-        with open(discover_json_path, 'r') as f:
-            data = json.load(f)
+        with open(discover_json_path, 'rb') as f:
+            for result in _iter_results(f):
+                candidates.append(_candidate_from_result(result))
     except FileNotFoundError:
         print(f"Error: {discover_json_path} not found", file=sys.stderr)
         return []
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         print(f"Error parsing JSON: {e}", file=sys.stderr)
         return []
     
-    for result in data.get('results', []):
-        rule_id = result.get('check_id', '')
-        file_path = result.get('path', '')
-        line_number = result.get('start', {}).get('line', 0)
-        message = result.get('message', '')
-        
-        # Extract metavariables for sink signature
-        metavars = result.get('extra', {}).get('metavars', {})
-        
-        # Score the candidate based on rule type and context
-        score = 0
-        sink_type = "unknown"
-        
-        if "redirect" in rule_id:
-            score += 3
-            sink_type = "redirect"
-        elif "cors" in rule_id:
-            score += 2
-            sink_type = "cors"
-        elif "cookie" in rule_id:
-            score += 2
-            sink_type = "cookie"
-        elif "absurl" in rule_id:
-            score += 1
-            sink_type = "absurl"
-        
-        # Extract method/function name if available
-        method_name = ""
-        if '$M' in metavars:
-            method_name = metavars['$M'].get('abstract_content', '')
-        
-        # Extract header name if available
-        header_name = ""
-        if '$H' in metavars:
-            header_name = metavars['$H'].get('abstract_content', '')
-        
-        # Extract class/object info
-        class_name = ""
-        if '$RESP' in metavars:
-            class_name = metavars['$RESP'].get('abstract_content', '')
-        elif '$OBJ' in metavars:
-            class_name = metavars['$OBJ'].get('abstract_content', '')
-        
-        candidate = {
-            'rule_id': rule_id,
-            'file_path': file_path,
-            'line_number': line_number,
-            'message': message,
-            'sink_type': sink_type,
-            'score': score,
-            'method_name': method_name,
-            'header_name': header_name,
-            'class_name': class_name,
-            'metavars': metavars
-        }
-        
-        candidates.append(candidate)
-    
     return candidates
 
+def _candidate_from_result(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a scored candidate sink from a single Semgrep result."""
+    rule_id = result.get('check_id', '')
+    file_path = result.get('path', '')
+    line_number = result.get('start', {}).get('line', 0)
+    message = result.get('message', '')
+    
+    # Extract metavariables for sink signature
+    metavars = result.get('extra', {}).get('metavars', {})
+    
+    # Score the candidate based on rule type; the first matching table entry wins
+    score, sink_type = next(
+        ((rule_score, rule_type) for needle, rule_score, rule_type in _RULE_TABLE if needle in rule_id),
+        (0, "unknown"),
+    )
+    
+    # Extract method/function name if available
+    method_name = ""
+    if '$M' in metavars:
+        method_name = metavars['$M'].get('abstract_content', '')
+    
+    # Extract header name if available
+    header_name = ""
+    if '$H' in metavars:
+        header_name = metavars['$H'].get('abstract_content', '')
+    
+    # Extract class/object info
+    class_name = ""
+    if '$RESP' in metavars:
+        class_name = metavars['$RESP'].get('abstract_content', '')
+    elif '$OBJ' in metavars:
+        class_name = metavars['$OBJ'].get('abstract_content', '')
+    
+    candidate = {
+        'rule_id': rule_id,
+        'file_path': file_path,
+        'line_number': line_number,
+        'message': message,
+        'sink_type': sink_type,
+        'score': score,
+        'method_name': method_name,
+        'header_name': header_name,
+        'class_name': class_name,
+        'metavars': metavars
+    }
+    
+    return candidate
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python3 extract_candidates.py <discover.json>", file=sys.stderr)
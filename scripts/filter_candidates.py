@@ -4,27 +4,38 @@ Filter candidate files for Psalm verification.
 """
 import json
 import sys
-from typing import Set
+from typing import Iterator, Set
+
+# Stream paths out of large discovery files when ijson is installed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_JSON_ERRORS = (json.JSONDecodeError,) if ijson is None else (json.JSONDecodeError, ijson.JSONError)
+
+def _iter_result_paths(f) -> Iterator[str]:
+    """Yield the path of every Semgrep result without building the full document when possible."""
+    if ijson is not None:
+        return ijson.items(f, 'results.item.path')
+    return (result.get('path', '') for result in json.load(f).get('results', []))
 
 def filter_candidate_files(discover_json_path: str) -> Set[str]:
     """Extract unique file paths from Semgrep discovery results."""
-    candidate_files = set()
-    
     try:
-        with open(discover_json_path, 'r') as f:
-            data = json.load(f)
+        with open(discover_json_path, 'rb') as f:
+            # Deduplicate while streaming; main() sorts once on output
+            candidate_files = {
+                file_path for file_path in _iter_result_paths(f)
+                if file_path and file_path.endswith('.php')
+            }
     except FileNotFoundError:
         print(f"Error: {discover_json_path} not found", file=sys.stderr)
         return set()
-    except json.JSONDecodeError as e:
+    except _JSON_ERRORS as e:
         print(f"Error parsing JSON: {e}", file=sys.stderr)
         return set()
     
-    for result in data.get('results', []):
-        file_path = result.get('path', '')
-        if file_path and file_path.endswith('.php'):
-            candidate_files.add(file_path)
-    
     return candidate_files
 
 def main():
@@ -3,65 +3,97 @@
 Generate temporary Psalm sink stubs from candidate sinks.
 """
 import csv
+import functools
+import io
 import sys
 import re
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
-def generate_psalm_stub(candidates: List[Dict[str, Any]]) -> str:
+# Candidate CSV columns that name the callable to stub
+_CANDIDATE_COLUMNS = ('method_name', 'class_name', 'function_name')
+
+# Generic sink stubs: the first three parameters of every candidate are taint sinks
+_METHOD_SINK_BODY_TMPL = (
+    "class {cls} {{\n"
+    "    /**\n"
+    "     * @psalm-taint-sink html $a\n"
+    "     * @psalm-taint-sink html $b\n"
+    "     * @psalm-taint-sink html $c\n"
+    "     */\n"
+    "    public function {method}($a = null, $b = null, $c = null) {{}}\n"
+    "}}\n\n"
+)
+_METHOD_SINK_TMPL = "namespace {ns};\n" + _METHOD_SINK_BODY_TMPL
+_METHOD_SINK_GLOBAL_TMPL = _METHOD_SINK_BODY_TMPL
+
+_FUNCTION_SINK_TMPL = (
+    "/**\n"
+    " * @psalm-taint-sink html $a\n"
+    " * @psalm-taint-sink html $b\n"
+    " * @psalm-taint-sink html $c\n"
+    " */\n"
+    "function {func}($a = null, $b = null, $c = null) {{}}\n\n"
+)
+
+@functools.lru_cache(maxsize=4096)
+def _split_ns(class_name: str) -> Tuple[str, str]:
+    """Split a qualified class name into (namespace, short_name); namespace is '' for global classes."""
+    namespace, _, class_short = class_name.rpartition('\\')
+    return namespace, class_short
+
+def _sink_target(candidate: Dict[str, Any]) -> Optional[Tuple[str, str, str]]:
+    """Return (signature, class_name, callable_name) for a candidate, or None if it names no callable.
+    An empty class_name means the callable is stubbed as a global function.
+    """
+    try:
+        method_name = (candidate.get('method_name') or '').strip()
+        class_name = (candidate.get('class_name') or '').strip()
+        func_name = (candidate.get('function_name') or '').strip()
+    except Exception:
+        return None
+
+    # Prefer function_name when class is empty
+    if class_name and method_name:
+        return f"{class_name}::{method_name}", class_name, method_name
+    elif func_name:
+        return func_name, '', func_name
+    elif method_name:  # method without class (fallback to global func)
+        return method_name, '', method_name
+    return None
+
+def generate_psalm_stub(candidates: Iterable[Dict[str, Any]]) -> str:
     """Generate Psalm stub content for candidate sinks.
     Policy change: treat ALL candidate function calls as sinks.
     If class_name present => method sink; otherwise => global function sink.
     Unknown params => mark first three params ($a,$b,$c) as taint-sink.
     """
-    stub_content = "<?php\n"
-    stub_content += "// Auto-generated temporary sink stubs\n"
-    stub_content += "// Generated from candidate sink discovery\n\n"
-    
-    # Group candidates by class/method for deduplication
-    seen_signatures = set()
+    buf = io.StringIO()
+    buf.write("<?php\n")
+    buf.write("// Auto-generated temporary sink stubs\n")
+    buf.write("// Generated from candidate sink discovery\n\n")
     
+    # Deduplicate by signature first so each sink is generated exactly once
+    unique: Dict[str, Tuple[str, str]] = {}
     for candidate in candidates:
-        try:
-            method_name = (candidate.get('method_name') or '').strip()
-            class_name = (candidate.get('class_name') or '').strip()
-            func_name = (candidate.get('function_name') or '').strip()
-        except Exception:
-            continue
-
-        # Prefer function_name when class is empty
-        if class_name and method_name:
-            signature = f"{class_name}::{method_name}"
-            if signature in seen_signatures:
-                continue
-            seen_signatures.add(signature)
-            stub_content += generate_generic_method_sink(class_name, method_name)
-        elif func_name:
-            signature = func_name
-            if signature in seen_signatures:
-                continue
-            seen_signatures.add(signature)
-            stub_content += generate_generic_function_sink(func_name)
-        elif method_name:  # method without class (fallback to global func)
-            signature = method_name
-            if signature in seen_signatures:
-                continue
-            seen_signatures.add(signature)
-            stub_content += generate_generic_function_sink(method_name)
+        target = _sink_target(candidate)
+        if target is not None:
+            signature, class_name, name = target
+            unique.setdefault(signature, (class_name, name))
+    
+    for class_name, name in unique.values():
+        if class_name:
+            buf.write(generate_generic_method_sink(class_name, name))
+        else:
+            buf.write(generate_generic_function_sink(name))
     
     # Always append framework-specific critical sinks (Laravel/Symfony)
-    stub_content += generate_fixed_framework_sinks()
-    return stub_content
+    buf.write(generate_fixed_framework_sinks())
+    return buf.getvalue()
 
 def generate_redirect_stub(class_name: str, method_name: str) -> str:
     """(Deprecated) Kept for compatibility; not used after policy change."""
-    # Extract namespace from class name if present
-    if '\\' in class_name:
-        namespace = '\\'.join(class_name.split('\\')[:-1])
-        class_short = class_name.split('\\')[-1]
-        stub = f"namespace {namespace};\n"
-    else:
-        class_short = class_name
-        stub = ""
+    namespace, class_short = _split_ns(class_name)
+    stub = f"namespace {namespace};\n" if namespace else ""
     
     stub += f"class {class_short} {{\n"
     stub += f"    /**\n"
@@ -74,13 +106,8 @@ def generate_redirect_stub(class_name: str, method_name: str) -> str:
 
 def generate_cors_stub(class_name: str, method_name: str) -> str:
     """(Deprecated) Kept for compatibility; not used after policy change."""
-    if '\\' in class_name:
-        namespace = '\\'.join(class_name.split('\\')[:-1])
-        class_short = class_name.split('\\')[-1]
-        stub = f"namespace {namespace};\n"
-    else:
-        class_short = class_name
-        stub = ""
+    namespace, class_short = _split_ns(class_name)
+    stub = f"namespace {namespace};\n" if namespace else ""
     
     stub += f"class {class_short} {{\n"
     stub += f"    /**\n"
@@ -93,13 +120,8 @@ def generate_cors_stub(class_name: str, method_name: str) -> str:
 
 def generate_cookie_stub(class_name: str, method_name: str) -> str:
     """(Deprecated) Kept for compatibility; not used after policy change."""
-    if '\\' in class_name:
-        namespace = '\\'.join(class_name.split('\\')[:-1])
-        class_short = class_name.split('\\')[-1]
-        stub = f"namespace {namespace};\n"
-    else:
-        class_short = class_name
-        stub = ""
+    namespace, class_short = _split_ns(class_name)
+    stub = f"namespace {namespace};\n" if namespace else ""
     
     stub += f"class {class_short} {{\n"
     stub += f"    /**\n"
@@ -111,34 +133,14 @@ def generate_cookie_stub(class_name: str, method_name: str) -> str:
     return stub
 
 def generate_generic_method_sink(class_name: str, method_name: str) -> str:
-    if '\\' in class_name:
-        namespace = '\\'.join(class_name.split('\\')[:-1])
-        class_short = class_name.split('\\')[-1]
-        stub = f"namespace {namespace};\n"
-    else:
-        class_short = class_name
-        stub = ""
-
-    stub += f"class {class_short} {{\n"
-    stub += f"    /**\n"
-    stub += f"     * @psalm-taint-sink html $a\n"
-    stub += f"     * @psalm-taint-sink html $b\n"
-    stub += f"     * @psalm-taint-sink html $c\n"
-    stub += f"     */\n"
-    stub += f"    public function {method_name}($a = null, $b = null, $c = null) {{}}\n"
-    stub += f"}}\n\n"
-    return stub
+    namespace, class_short = _split_ns(class_name)
+    if namespace:
+        return _METHOD_SINK_TMPL.format(ns=namespace, cls=class_short, method=method_name)
+    return _METHOD_SINK_GLOBAL_TMPL.format(cls=class_short, method=method_name)
 
 def generate_generic_function_sink(function_name: str) -> str:
-    stub = ""
     # global namespace function
-    stub += f"/**\n"
-    stub += f" * @psalm-taint-sink html $a\n"
-    stub += f" * @psalm-taint-sink html $b\n"
-    stub += f" * @psalm-taint-sink html $c\n"
-    stub += f" */\n"
-    stub += f"function {function_name}($a = null, $b = null, $c = null) {{}}\n\n"
-    return stub
+    return _FUNCTION_SINK_TMPL.format(func=function_name)
 
 def generate_fixed_framework_sinks() -> str:
     """Append explicit sinks for Laravel/Symfony redirect/url APIs and header()."""
@@ -186,6 +188,16 @@ def generate_fixed_framework_sinks() -> str:
 
     return "".join(parts)
 
+def _iter_candidates(f) -> Iterator[Dict[str, str]]:
+    """Stream the callable-naming columns of each candidate CSV row."""
+    reader = csv.reader(f)
+    header = next(reader, [])
+    index = {name: i for i, name in enumerate(header)}
+    # extract_candidates.py output has no function_name column; missing columns read as empty
+    columns = [(name, index[name]) for name in _CANDIDATE_COLUMNS if name in index]
+    for row in reader:
+        yield {name: row[i] for name, i in columns if i < len(row)}
+
 def main():
     if len(sys.argv) != 2:
         print("Usage: python3 gen_temp_sinks_stub.py <candidate_sinks.csv>", file=sys.stderr)
@@ -194,14 +206,12 @@ def main():
     csv_path = sys.argv[1]
     
     try:
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            candidates = list(reader)
+        with open(csv_path, 'r', newline='') as f:
+            stub_content = generate_psalm_stub(_iter_candidates(f))
     except FileNotFoundError:
         print(f"Error: {csv_path} not found", file=sys.stderr)
         sys.exit(1)
     
-    stub_content = generate_psalm_stub(candidates)
     print(stub_content)
 
 if __name__ == "__main__":
@@ -8,12 +8,18 @@ import yaml
 from typing import Dict, List, Any
 from pathlib import Path
 
+# Prefer the libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 def load_existing_registry(registry_path: str) -> Dict[str, Any]:
     """Load existing registry or create new one."""
     if Path(registry_path).exists():
         try:
             with open(registry_path, 'r') as f:
-                return yaml.safe_load(f) or {}
+                return yaml.load(f, Loader=_Loader) or {}
         except Exception as e:
             print(f"Warning: Could not load existing registry: {e}", file=sys.stderr)
     
@@ -119,7 +125,7 @@ def main():
     # Save updated registry
     try:
         with open(registry_path, 'w') as f:
-            yaml.dump(registry, f, default_flow_style=False, sort_keys=True)
+            yaml.dump(registry, f, Dumper=_Dumper, default_flow_style=False, sort_keys=True)
         print(f"Updated registry with {len(confirmed_sinks)} confirmed sinks", file=sys.stderr)
     except Exception as e:
         print(f"Error saving registry: {e}", file=sys.stderr)